@@ -0,0 +1,7 @@
+-- Timestamps With Time Zone
+-- This migration converts users timestamps to TIMESTAMPTZ.
+-- Existing values were written as naive UTC, so they are interpreted as UTC.
+
+ALTER TABLE users
+    ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at TYPE TIMESTAMPTZ USING updated_at AT TIME ZONE 'UTC';
@@ -0,0 +1,6 @@
+-- Case-Insensitive User Lookups
+-- This migration adds unique functional indexes on lowercased email and username.
+-- Email and username lookups compare LOWER(column), which only these indexes can serve.
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower ON users (LOWER(email));
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username_lower ON users (LOWER(username));
@@ -0,0 +1,16 @@
+-- Users updated_at Trigger
+-- This migration moves updated_at maintenance into the database.
+-- A BEFORE UPDATE trigger stamps every modified row, so the application no longer binds it.
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS users_set_updated_at ON users;
+CREATE TRIGGER users_set_updated_at
+    BEFORE UPDATE ON users
+    FOR EACH ROW
+    EXECUTE FUNCTION set_updated_at();
@@ -13,7 +13,7 @@ from src.infrastructure.database.connection import get_db
 from src.infrastructure.repositories.user_repository import UserRepository
 
 
-def get_user_repository(
+async def get_user_repository(
     session: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserRepository:
     """Get user repository instance.
@@ -27,7 +27,7 @@ def get_user_repository(
     return UserRepository(session)
 
 
-def get_user_service(
+async def get_user_service(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
 ) -> UserService:
     """Get user service instance.
@@ -39,3 +39,8 @@ def get_user_service(
         UserService instance.
     """
     return UserService(user_repo)
+
+
+# Shared annotation for routes. FastAPI caches the resolved service per request,
+# so the session, repository and service are each built once per request.
+UserServiceDep = Annotated[UserService, Depends(get_user_service, use_cache=True)]
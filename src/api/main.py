@@ -3,19 +3,31 @@
 This module creates and configures the FastAPI application.
 """
 
+import os
+import sys
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Literal
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-from src.domain.exceptions import DomainException
-from src.infrastructure.config import settings
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+
+from src.api.routes import users
+from src.domain.exceptions import (
+    DomainException,
+    DomainValidationError,
+    EntityAlreadyExistsError,
+    EntityNotFoundError,
+)
+from src.infrastructure.config import get_settings
+from src.infrastructure.database.connection import configure_orm_mappers, warmup_pool
 from src.infrastructure.logging.logger import configure_logging, get_logger
 
-# Configure logging
-configure_logging()
+settings = get_settings()
+
+# structlog loggers are lazy proxies, so this is safe before configure_logging() runs
 logger = get_logger(__name__)
 
 
@@ -32,6 +44,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         None
     """
     # Startup
+    configure_logging()
+    configure_orm_mappers()
+    await warmup_pool()
     logger.info("application_starting", app_name=settings.app.name, version=settings.app.version)
     yield
     # Shutdown
@@ -44,21 +59,55 @@ app = FastAPI(
     version=settings.app.version,
     description="TinyBigCorp Enterprise Backend - Clean Architecture with FastAPI",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.api.cors_origins_list,
+    allow_origin_regex=settings.api.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger responses such as user listings; small ones are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+# Register routers
+app.include_router(users.router, prefix=settings.api.v1_prefix)
+
+
+# HTTP status codes for domain exceptions; anything else defaults to 400
+_DOMAIN_EXCEPTION_STATUS_CODES: dict[type[DomainException], int] = {
+    DomainValidationError: status.HTTP_400_BAD_REQUEST,
+    EntityNotFoundError: status.HTTP_404_NOT_FOUND,
+    EntityAlreadyExistsError: status.HTTP_409_CONFLICT,
+}
+
+
+def _domain_exception_status_code(exc: DomainException) -> int | None:
+    """Resolve the HTTP status code for a domain exception.
+
+    The exception's MRO is walked, so subclasses of a mapped exception share its status.
+
+    Args:
+        exc: The domain exception.
+
+    Returns:
+        The HTTP status code of the closest mapped class, or None if none is mapped.
+    """
+    for exc_type in type(exc).__mro__:
+        status_code = _DOMAIN_EXCEPTION_STATUS_CODES.get(exc_type)
+        if status_code is not None:
+            return status_code
+    return None
+
 
 # Global exception handler for domain exceptions
 @app.exception_handler(DomainException)
-async def domain_exception_handler(request: Request, exc: DomainException) -> JSONResponse:
+async def domain_exception_handler(request: Request, exc: DomainException) -> ORJSONResponse:
     """Handle domain exceptions globally.
 
     Args:
@@ -68,21 +117,25 @@ async def domain_exception_handler(request: Request, exc: DomainException) -> JS
     Returns:
         JSON response with error details.
     """
-    logger.error(
+    status_code = _domain_exception_status_code(exc)
+    # Mapped exceptions are routine client errors (404 scans, duplicate signups), so
+    # they are logged below error level and stay in the log buffer
+    log = logger.warning if status_code is not None else logger.error
+    log(
         "domain_exception",
         exception_type=type(exc).__name__,
         message=exc.message,
         path=request.url.path,
     )
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
+    return ORJSONResponse(
+        status_code=status_code or status.HTTP_400_BAD_REQUEST,
         content={"error": type(exc).__name__, "message": exc.message},
     )
 
 
 # Global exception handler for unexpected errors
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions globally.
 
     Args:
@@ -98,7 +151,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         message=str(exc),
         path=request.url.path,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
@@ -107,25 +160,62 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
 
-# Health check endpoint
-@app.get("/health", tags=["Health"])
-async def health_check() -> dict[str, str]:
+_HEALTH_OK = b"ok"
+
+
+# Health check endpoint, polled by load balancers and orchestrators
+@app.get("/health", response_class=PlainTextResponse, include_in_schema=False)
+async def health_check() -> PlainTextResponse:
     """
     Health check endpoint.
 
     Returns:
-        dict: Health status
+        PlainTextResponse: A static "ok" body, returned directly so no serialization runs.
     """
-    return {"status": "healthy", "version": "0.1.0", "environment": settings.app.env}
+    return PlainTextResponse(_HEALTH_OK)
 
 
 def main() -> None:
-    """Main entry point for running the application via console script."""
-    import uvicorn
-
-    uvicorn.run(
-        "src.api.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.app.debug,
+    """Main entry point for running the application via console script.
+
+    In debug mode a single reloading uvicorn process is started. Otherwise the
+    process is replaced by gunicorn supervising 2N+1 uvicorn workers.
+    """
+    workers = (os.cpu_count() or 1) * 2 + 1
+
+    # gunicorn is POSIX-only, so Windows always runs uvicorn directly
+    if settings.app.debug or sys.platform == "win32":
+        import uvicorn
+
+        # uvloop is not available on Windows, fall back to the default asyncio loop there
+        loop: Literal["asyncio", "uvloop"] = "asyncio" if sys.platform == "win32" else "uvloop"
+
+        uvicorn.run(
+            "src.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=settings.app.debug,
+            loop=loop,
+            http="httptools",
+            workers=1 if settings.app.debug else workers,
+        )
+        return
+
+    # UvicornWorker picks uvloop and httptools automatically when they are installed.
+    # gunicorn is run as a module of the current interpreter so this works without the
+    # virtualenv's bin/ directory on PATH (e.g. a console script invoked by absolute path)
+    os.execv(
+        sys.executable,
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "src.api.main:app",
+            "--worker-class",
+            "uvicorn.workers.UvicornWorker",
+            "--workers",
+            str(workers),
+            "--bind",
+            "0.0.0.0:8000",
+        ],
     )
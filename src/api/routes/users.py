@@ -2,20 +2,23 @@
 
 This module defines all user-related API endpoints.
 Routers are responsible ONLY for parsing requests and returning responses.
-All business logic is delegated to the UserService.
-"""
+All business logic is delegated to the UserService, and domain exceptions are
+translated to HTTP errors by the global handlers in ``src.api.main``.
 
-from typing import Annotated
+Handlers return a Response directly: the DTOs coming from UserService are already
+validated, so this skips FastAPI's second validation pass against ``response_model``.
+Users and user pages are serialized to JSON bytes in one pydantic-core call.
+The ``response_model`` arguments are kept for the OpenAPI schema.
+"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Response, status
 
-from src.api.dependencies import get_user_service
-from src.application.dtos.user_dto import CreateUserCommand, UpdateUserCommand, UserDto
-from src.application.services.user_service import UserService
-from src.domain.exceptions import (
-    DomainValidationError,
-    EntityAlreadyExistsError,
-    EntityNotFoundError,
+from src.api.dependencies import UserServiceDep
+from src.application.dtos.user_dto import (
+    USER_DTO_LIST_ADAPTER,
+    CreateUserCommand,
+    UpdateUserCommand,
+    UserDto,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -29,8 +32,8 @@ router = APIRouter(prefix="/users", tags=["users"])
 )
 async def create_user(
     command: CreateUserCommand,
-    user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserDto:
+    user_service: UserServiceDep,
+) -> Response:
     """Create a new user.
 
     Args:
@@ -41,14 +44,14 @@ async def create_user(
         Created user data.
 
     Raises:
-        HTTPException: If validation fails or user already exists.
+        EntityAlreadyExistsError: If the email or username is already taken.
     """
-    try:
-        return await user_service.create_user(command)
-    except DomainValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message) from e
-    except EntityAlreadyExistsError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message) from e
+    user = await user_service.create_user(command)
+    return Response(
+        user.model_dump_json(),
+        media_type="application/json",
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
@@ -58,8 +61,8 @@ async def create_user(
 )
 async def get_user(
     user_id: int,
-    user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserDto:
+    user_service: UserServiceDep,
+) -> Response:
     """Get a user by ID.
 
     Args:
@@ -70,12 +73,10 @@ async def get_user(
         User data.
 
     Raises:
-        HTTPException: If user is not found.
+        EntityNotFoundError: If user is not found.
     """
-    try:
-        return await user_service.get_user_by_id(user_id)
-    except EntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    user = await user_service.get_user_by_id(user_id)
+    return Response(user.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -84,10 +85,10 @@ async def get_user(
     summary="List all users",
 )
 async def list_users(
-    user_service: Annotated[UserService, Depends(get_user_service)],
+    user_service: UserServiceDep,
     skip: int = 0,
     limit: int = 100,
-) -> list[UserDto]:
+) -> Response:
     """List all users with pagination.
 
     Args:
@@ -98,7 +99,8 @@ async def list_users(
     Returns:
         List of users.
     """
-    return await user_service.list_users(skip=skip, limit=limit)
+    users = await user_service.list_users(skip=skip, limit=limit)
+    return Response(USER_DTO_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @router.patch(
@@ -109,8 +111,8 @@ async def list_users(
 async def update_user(
     user_id: int,
     command: UpdateUserCommand,
-    user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserDto:
+    user_service: UserServiceDep,
+) -> Response:
     """Update a user.
 
     Args:
@@ -122,12 +124,10 @@ async def update_user(
         Updated user data.
 
     Raises:
-        HTTPException: If user is not found.
+        EntityNotFoundError: If user is not found.
     """
-    try:
-        return await user_service.update_user(user_id, command)
-    except EntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    user = await user_service.update_user(user_id, command)
+    return Response(user.model_dump_json(), media_type="application/json")
 
 
 @router.post(
@@ -137,8 +137,8 @@ async def update_user(
 )
 async def deactivate_user(
     user_id: int,
-    user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserDto:
+    user_service: UserServiceDep,
+) -> Response:
     """Deactivate a user account.
 
     Args:
@@ -149,9 +149,7 @@ async def deactivate_user(
         Deactivated user data.
 
     Raises:
-        HTTPException: If user is not found.
+        EntityNotFoundError: If user is not found.
     """
-    try:
-        return await user_service.deactivate_user(user_id)
-    except EntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    user = await user_service.deactivate_user(user_id)
+    return Response(user.model_dump_json(), media_type="application/json")
@@ -5,7 +5,7 @@ This module defines all Data Transfer Objects for User operations.
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 
 
 class CreateUserCommand(BaseModel):
@@ -20,14 +20,6 @@ class CreateUserCommand(BaseModel):
     username: str = Field(..., min_length=3, max_length=50, description="Unique username")
     full_name: str = Field(..., min_length=1, max_length=100, description="User full name")
 
-    def is_valid(self) -> bool:
-        """Validate the command.
-
-        Returns:
-            True if the command is valid.
-        """
-        return len(self.username) >= 3 and len(self.full_name) >= 1
-
 
 class UpdateUserCommand(BaseModel):
     """Command for updating an existing user."""
@@ -43,10 +35,10 @@ class UserDto(BaseModel):
     """User response DTO.
 
     This DTO is used to return user data to the client.
-    It maps from the User domain entity.
+    It maps from the User domain entity, which is trusted data, so it is not strict.
     """
 
-    model_config = ConfigDict(strict=True, from_attributes=True)
+    model_config = ConfigDict(from_attributes=True)
 
     id: int = Field(..., description="User unique identifier")
     email: str = Field(..., description="User email address")
@@ -66,3 +58,7 @@ class UserListDto(BaseModel):
     total: int = Field(..., description="Total number of users")
     skip: int = Field(..., description="Number of records skipped")
     limit: int = Field(..., description="Maximum number of records returned")
+
+
+# Validates and serializes a whole page of users in a single pydantic-core call
+USER_DTO_LIST_ADAPTER = TypeAdapter(list[UserDto])
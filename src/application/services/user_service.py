@@ -3,15 +3,14 @@
 This module contains the User service implementing user-related use cases.
 """
 
-from datetime import datetime
-
-from src.application.dtos.user_dto import CreateUserCommand, UpdateUserCommand, UserDto
-from src.domain.entities.user import User
-from src.domain.exceptions import (
-    DomainValidationError,
-    EntityAlreadyExistsError,
-    EntityNotFoundError,
+from src.application.dtos.user_dto import (
+    USER_DTO_LIST_ADAPTER,
+    CreateUserCommand,
+    UpdateUserCommand,
+    UserDto,
 )
+from src.domain.entities.user import User
+from src.domain.exceptions import EntityAlreadyExistsError, EntityNotFoundError
 from src.domain.repositories.user_repository import IUserRepository
 
 
@@ -30,6 +29,31 @@ class UserService:
         """
         self._user_repo = user_repository
 
+    @staticmethod
+    def _to_dto(user: User) -> UserDto:
+        """Map a domain entity to its response DTO without re-validating it.
+
+        Args:
+            user: The User entity returned by the repository.
+
+        Returns:
+            UserDto built with model_construct, which skips validation.
+
+        Raises:
+            ValueError: If the user has not been persisted yet.
+        """
+        if user.id is None or user.created_at is None or user.updated_at is None:
+            raise ValueError("Cannot build a UserDto from an unsaved User")
+        return UserDto.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
     async def create_user(self, command: CreateUserCommand) -> UserDto:
         """Create a new user.
 
@@ -40,38 +64,33 @@ class UserService:
             UserDto containing the created user data.
 
         Raises:
-            DomainValidationError: If the command is invalid.
             EntityAlreadyExistsError: If a user with the email or username exists.
         """
-        if not command.is_valid():
-            raise DomainValidationError("Invalid user creation command")
-
         # Check if user already exists
-        existing_user = await self._user_repo.get_by_email(command.email)
-        if existing_user:
-            raise EntityAlreadyExistsError("User", command.email)
-
-        existing_user = await self._user_repo.get_by_username(command.username)
+        existing_user = await self._user_repo.get_by_email_or_username(
+            command.email, command.username
+        )
         if existing_user:
+            if existing_user.email.lower() == command.email.lower():
+                raise EntityAlreadyExistsError("User", command.email)
             raise EntityAlreadyExistsError("User", command.username)
 
-        # Create domain entity
-        now = datetime.utcnow()
+        # Create domain entity; the database assigns the ID and timestamps
         user = User(
             id=None,
             email=command.email,
             username=command.username,
             full_name=command.full_name,
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=None,
+            updated_at=None,
         )
 
         # Persist via repository
         created_user = await self._user_repo.create(user)
 
         # Map to DTO
-        return UserDto.model_validate(created_user)
+        return self._to_dto(created_user)
 
     async def get_user_by_id(self, user_id: int) -> UserDto:
         """Retrieve a user by ID.
@@ -89,7 +108,7 @@ class UserService:
         if not user:
             raise EntityNotFoundError("User", user_id)
 
-        return UserDto.model_validate(user)
+        return self._to_dto(user)
 
     async def list_users(self, skip: int = 0, limit: int = 100) -> list[UserDto]:
         """List all users with pagination.
@@ -102,7 +121,7 @@ class UserService:
             List of UserDto objects.
         """
         users = await self._user_repo.list_all(skip=skip, limit=limit)
-        return [UserDto.model_validate(user) for user in users]
+        return USER_DTO_LIST_ADAPTER.validate_python(users, from_attributes=True)
 
     async def update_user(self, user_id: int, command: UpdateUserCommand) -> UserDto:
         """Update an existing user.
@@ -128,7 +147,7 @@ class UserService:
         # Persist changes
         updated_user = await self._user_repo.update(user)
 
-        return UserDto.model_validate(updated_user)
+        return self._to_dto(updated_user)
 
     async def deactivate_user(self, user_id: int) -> UserDto:
         """Deactivate a user account.
@@ -152,4 +171,4 @@ class UserService:
         # Persist changes
         updated_user = await self._user_repo.update(user)
 
-        return UserDto.model_validate(updated_user)
+        return self._to_dto(updated_user)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User domain entity.
 
@@ -20,8 +20,9 @@ class User:
     username: str
     full_name: str
     is_active: bool
-    created_at: datetime
-    updated_at: datetime
+    # Timestamps are assigned by the database; None until the user is persisted
+    created_at: datetime | None
+    updated_at: datetime | None
 
     def deactivate(self) -> None:
         """Deactivate the user account.
@@ -37,8 +38,9 @@ class User:
     def update_profile(self, full_name: str) -> None:
         """Update user profile information.
 
+        The database refreshes ``updated_at`` when the change is saved.
+
         Args:
             full_name: The new full name for the user.
         """
         self.full_name = full_name
-        self.updated_at = datetime.utcnow()
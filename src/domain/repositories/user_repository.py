@@ -51,6 +51,19 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_email_or_username(self, email: str, username: str) -> User | None:
+        """Retrieve a user matching either the email address or the username.
+
+        Args:
+            email: The email address to match.
+            username: The username to match.
+
+        Returns:
+            The first matching User entity if any, None otherwise.
+        """
+        pass
+
     @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
         """List all users with pagination.
@@ -76,6 +89,18 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, users: list[User]) -> list[User]:
+        """Create several users at once.
+
+        Args:
+            users: The user entities to create.
+
+        Returns:
+            The created user entities with generated IDs, in input order.
+        """
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         """Update an existing user.
@@ -3,12 +3,21 @@
 This module handles application configuration using Pydantic Settings.
 """
 
+from functools import cached_property, lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class DatabaseSettings(BaseSettings):
-    """Database configuration settings."""
+    """Database configuration settings.
+
+    The pool is per worker process. Size it so that ``pool_size + max_overflow``
+    roughly matches the number of database operations a worker runs concurrently,
+    while ``workers * (pool_size + max_overflow)`` stays below the server's
+    ``max_connections``. The defaults keep a 4-CPU host (9 workers) under
+    PostgreSQL's default of 100.
+    """
 
     model_config = SettingsConfigDict(env_prefix="DATABASE_")
 
@@ -17,8 +26,17 @@ class DatabaseSettings(BaseSettings):
     name: str = Field(default="tinybigcorp", description="Database name")
     user: str = Field(default="postgres", description="Database user")
     password: str = Field(default="postgres", description="Database password")
-    pool_size: int = Field(default=20, description="Connection pool size")
-    max_overflow: int = Field(default=10, description="Maximum pool overflow")
+    pool_size: int = Field(default=5, description="Connection pool size per worker")
+    max_overflow: int = Field(default=5, description="Maximum pool overflow per worker")
+    pool_warmup: int = Field(
+        default=2, description="Connections each worker opens at startup (capped at pool_size)"
+    )
+    pool_timeout: int = Field(
+        default=30, description="Seconds to wait for a pooled connection before failing"
+    )
+    pool_recycle: int = Field(
+        default=1800, description="Seconds after which pooled connections are replaced"
+    )
 
     @property
     def url(self) -> str:
@@ -42,6 +60,15 @@ class AppSettings(BaseSettings):
     env: str = Field(default="development", description="Environment")
     debug: bool = Field(default=True, description="Debug mode")
 
+    @property
+    def is_production(self) -> bool:
+        """Check whether the application runs in production.
+
+        Returns:
+            True if the environment is "production".
+        """
+        return self.env == "production"
+
 
 class APISettings(BaseSettings):
     """API configuration settings."""
@@ -52,10 +79,14 @@ class APISettings(BaseSettings):
     cors_origins: str = Field(
         default="http://localhost:4200", description="CORS allowed origins (comma-separated)"
     )
+    cors_origin_regex: str | None = Field(
+        default=None,
+        description="Regex matching allowed CORS origins, for large or wildcard origin sets",
+    )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Get CORS origins as a list.
+        """Get CORS origins as a list, parsed once per settings instance.
 
         Returns:
             List of allowed CORS origins.
@@ -83,5 +114,16 @@ class Settings(BaseSettings):
     log: LogSettings = Field(default_factory=LogSettings)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings.
+
+    Settings are read from the environment on first call and cached afterwards.
+    ``get_settings.cache_clear()`` only affects later calls: the database engine and
+    the FastAPI app are built from the settings when their modules are imported, so
+    changing those requires a process restart.
+
+    Returns:
+        The cached Settings instance.
+    """
+    return Settings()
@@ -3,12 +3,15 @@
 This module handles database connection and session management.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from src.infrastructure.config import settings
+from src.infrastructure.config import get_settings
+from src.infrastructure.logging.logger import get_logger
 
 
 class Base(DeclarativeBase):
@@ -17,13 +20,24 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
+settings = get_settings()
+
+# Create async engine once per process; sessions check connections out of its pool
 engine = create_async_engine(
     settings.database.url,
-    echo=settings.app.debug,
+    echo=settings.app.debug and not settings.app.is_production,
     pool_size=settings.database.pool_size,
     max_overflow=settings.database.max_overflow,
+    pool_timeout=settings.database.pool_timeout,
+    pool_recycle=settings.database.pool_recycle,
+    # pool_recycle only replaces connections by age; pre-ping also catches connections
+    # dropped by a server restart, failover or idle-timeout proxy, which LIFO reuse
+    # makes more likely for the idle surplus
     pool_pre_ping=True,
+    # Reuse the most recently returned connection so idle ones can age out
+    pool_use_lifo=True,
+    # Compiled SQL cache entries (SQLAlchemy default: 500)
+    query_cache_size=2048,
 )
 
 # Create session factory
@@ -40,12 +54,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session.
 
     This is a dependency that provides a database session to routes.
+    The session returns its connection to the pool when the request ends.
 
     Yields:
         AsyncSession: Database session.
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+def configure_orm_mappers() -> None:
+    """Configure all registered ORM mappers eagerly.
+
+    SQLAlchemy configures mappers lazily on first use, which would otherwise
+    land on the first database request served by each worker.
+    """
+    Base.registry.configure()
+
+
+async def warmup_pool() -> None:
+    """Open ``pool_warmup`` connections before the first request arrives.
+
+    The pool connects lazily, so without this the first requests of each worker
+    pay for the TCP handshake and PostgreSQL authentication. Warm-up is best
+    effort: connections that fail are logged and opened on demand later.
+    """
+    count = min(settings.database.pool_warmup, settings.database.pool_size)
+
+    async def _ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_ping() for _ in range(count)), return_exceptions=True)
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        # Looked up here so importing this module does not import structlog
+        get_logger(__name__).warning(
+            "pool_warmup_failed",
+            failed=len(errors),
+            requested=count,
+            error=repr(errors[0]),
+        )
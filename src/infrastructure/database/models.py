@@ -5,8 +5,9 @@ This module defines the SQLAlchemy ORM model for the users table.
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import DDL, Boolean, DateTime, Index, Integer, String, event, func
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.ddl import ExecutableDDLElement
 
 from src.infrastructure.database.connection import Base
 
@@ -25,11 +26,57 @@ class UserModel(Base):
     username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     full_name: Mapped[str] = mapped_column(String(100), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )  # Maintained on UPDATE by the users_set_updated_at trigger
+
+    # Back the case-insensitive email/username lookups in UserRepository
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        Index("ix_users_username_lower", func.lower(username), unique=True),
     )
 
     def __repr__(self) -> str:
         """String representation of the user model."""
         return f"<UserModel(id={self.id}, username={self.username}, email={self.email})>"
+
+
+def _postgresql_ddl(statement: str) -> ExecutableDDLElement:
+    """Build a DDL statement that only runs on PostgreSQL.
+
+    Args:
+        statement: The raw DDL to execute.
+
+    Returns:
+        The DDL element, suitable for a table ``after_create`` listener.
+    """
+    # SQLAlchemy 2.0 ships DDL.__init__ without annotations
+    return DDL(statement).execute_if(dialect="postgresql")  # type: ignore[no-untyped-call]
+
+
+# Keep updated_at current in the database instead of binding it on every UPDATE
+event.listen(
+    UserModel.__table__,
+    "after_create",
+    _postgresql_ddl(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ),
+)
+event.listen(
+    UserModel.__table__,
+    "after_create",
+    _postgresql_ddl(
+        "CREATE TRIGGER users_set_updated_at BEFORE UPDATE ON users "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    ),
+)
@@ -3,12 +3,116 @@
 This module configures Structlog for structured JSON logging.
 """
 
+import atexit
+import io
 import logging
 import sys
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO, cast
 
-import structlog
+import orjson
 
-from src.infrastructure.config import settings
+from src.infrastructure.config import get_settings
+
+if TYPE_CHECKING:
+    import structlog
+
+# JSON log lines are collected in a buffer of this size and written out in one syscall
+_LOG_BUFFER_SIZE = 4096
+# Maximum time (seconds) a buffered log line waits before it is written
+_LOG_FLUSH_INTERVAL = 1.0
+
+
+class _BufferedBytesLogger:
+    """structlog logger that writes rendered JSON lines to a buffered binary stream.
+
+    ``structlog.BytesLogger`` flushes after every message, turning each log line into
+    its own ``write()`` syscall. This logger leaves debug, info and warning lines in
+    the stream buffer, where the log-flusher thread picks them up, but flushes right
+    away for error and above so they survive a worker being killed (e.g. by
+    gunicorn's timeout) and are not delayed behind lower-level output.
+    """
+
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """Initialize the logger.
+
+        Args:
+            stream: The buffered binary stream to write lines to.
+        """
+        self._stream = stream
+
+    def _write(self, message: bytes) -> None:
+        """Append a line to the stream buffer."""
+        self._stream.write(message + b"\n")
+
+    def _write_and_flush(self, message: bytes) -> None:
+        """Append a line to the stream buffer and flush it immediately."""
+        self._stream.write(message + b"\n")
+        self._stream.flush()
+
+    # structlog calls the method named after the event's level
+    debug = info = warning = warn = msg = log = _write
+    error = critical = exception = fatal = _write_and_flush
+
+
+def _flush_periodically(stream: BinaryIO, interval: float) -> None:
+    """Flush the stream every ``interval`` seconds.
+
+    Args:
+        stream: The writer to flush.
+        interval: Seconds between flushes.
+    """
+    while True:
+        time.sleep(interval)
+        stream.flush()
+
+
+@lru_cache(maxsize=1)
+def _open_buffered_stdout() -> BinaryIO:
+    """Open a block-buffered binary stream on the stdout file descriptor.
+
+    The stream is opened once per process, together with its flusher thread.
+
+    Returns:
+        A writer with a ``_LOG_BUFFER_SIZE`` byte buffer, or ``sys.stdout.buffer``
+        when stdout is not backed by a file descriptor (e.g. captured in tests).
+    """
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return sys.stdout.buffer
+    stream = io.BufferedWriter(io.FileIO(fileno, "w", closefd=False), buffer_size=_LOG_BUFFER_SIZE)
+    threading.Thread(
+        target=_flush_periodically,
+        args=(stream, _LOG_FLUSH_INTERVAL),
+        name="log-flusher",
+        daemon=True,
+    ).start()
+    atexit.register(stream.flush)
+    return stream
+
+
+@lru_cache(maxsize=8)
+def _resolve_log_level(level: str) -> int:
+    """Resolve a log level name to its numeric value.
+
+    Args:
+        level: The level name from settings, in any case (e.g. ``"info"``).
+
+    Returns:
+        The numeric logging level.
+
+    Raises:
+        ValueError: If the name is not a known logging level.
+    """
+    resolved = logging.getLevelName(level.upper())
+    if not isinstance(resolved, int):
+        raise ValueError(f"Invalid log level: {level!r}")
+    return resolved
 
 
 def configure_logging() -> None:
@@ -16,45 +120,72 @@ def configure_logging() -> None:
 
     This sets up JSON-formatted logging with context awareness.
     """
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.log.level.upper()),
-    )
+    # Imported here so that importing this module stays cheap
+    import structlog
+
+    settings = get_settings()
+    level = _resolve_log_level(settings.log.level)
+
+    # Application logs bypass stdlib logging; this only covers third-party libraries
+    if not logging.getLogger().handlers:
+        logging.basicConfig(format="%(message)s", stream=sys.stdout, level=level)
+
+    shared_processors: list[structlog.typing.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+    ]
+    # orjson emits str values as-is and renders straight to bytes for the logger;
+    # tracebacks are rendered as structured dicts (without frame locals, which may
+    # hold credentials)
+    json_processors: list[structlog.typing.Processor] = [
+        *shared_processors,
+        structlog.processors.ExceptionRenderer(
+            structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+        ),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ]
+    console_processors: list[structlog.typing.Processor] = [
+        *shared_processors,
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+        structlog.dev.ConsoleRenderer(),
+    ]
 
     # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.filter_by_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            (
-                structlog.processors.JSONRenderer()
-                if settings.log.format == "json"
-                else structlog.dev.ConsoleRenderer()
-            ),
-        ],
-        wrapper_class=structlog.stdlib.BoundLogger,
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
-
-
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+    if settings.log.format == "json":
+        json_logger = _BufferedBytesLogger(_open_buffered_stdout())
+        structlog.configure(
+            processors=json_processors,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            context_class=dict,
+            logger_factory=lambda *args: json_logger,
+            cache_logger_on_first_use=True,
+        )
+    else:
+        structlog.configure(
+            processors=console_processors,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            context_class=dict,
+            logger_factory=structlog.PrintLoggerFactory(sys.stdout),
+            cache_logger_on_first_use=True,
+        )
+
+
+@lru_cache(maxsize=128)
+def get_logger(name: str) -> "structlog.typing.FilteringBoundLogger":
     """Get a configured logger instance.
 
+    Loggers are cached per name, so repeated calls return the same instance.
+
     Args:
         name: The logger name (usually __name__).
 
     Returns:
         Configured structlog logger.
     """
-    return structlog.get_logger(name)
+    import structlog
+
+    # "logger" is reserved by structlog.get_logger(), so the name is bound as logger_name
+    return cast("structlog.typing.FilteringBoundLogger", structlog.get_logger(logger_name=name))
@@ -3,13 +3,32 @@
 This module contains the concrete implementation of IUserRepository.
 """
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, insert, lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import IUserRepository
 from src.infrastructure.database.models import UserModel
 
+# Lookup statements built once; lambda_stmt caches the compiled SQL by the lambda's
+# code location, so executing them skips Select construction and cache-key generation.
+_SELECT_BY_EMAIL = lambda_stmt(
+    lambda: select(UserModel).where(func.lower(UserModel.email) == bindparam("email"))
+)
+_SELECT_BY_USERNAME = lambda_stmt(
+    lambda: select(UserModel).where(func.lower(UserModel.username) == bindparam("username"))
+)
+_SELECT_BY_EMAIL_OR_USERNAME = lambda_stmt(
+    lambda: select(UserModel)
+    .where(
+        or_(
+            func.lower(UserModel.email) == bindparam("email"),
+            func.lower(UserModel.username) == bindparam("username"),
+        )
+    )
+    .limit(1)
+)
+
 
 class UserRepository(IUserRepository):
     """Concrete implementation of IUserRepository using SQLAlchemy.
@@ -35,98 +54,130 @@ class UserRepository(IUserRepository):
         Returns:
             User domain entity.
         """
+        # Positional arguments, in User field order
         return User(
-            id=model.id,
-            email=model.email,
-            username=model.username,
-            full_name=model.full_name,
-            is_active=model.is_active,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
-
-    def _to_model(self, entity: User) -> UserModel:
-        """Map domain entity to ORM model.
-
-        Args:
-            entity: The User domain entity.
-
-        Returns:
-            UserModel ORM instance.
-        """
-        return UserModel(
-            id=entity.id,
-            email=entity.email,
-            username=entity.username,
-            full_name=entity.full_name,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
+            model.id,
+            model.email,
+            model.username,
+            model.full_name,
+            model.is_active,
+            model.created_at,
+            model.updated_at,
         )
 
     async def get_by_id(self, user_id: int) -> User | None:
         """Retrieve a user by ID."""
-        result = await self._session.execute(select(UserModel).where(UserModel.id == user_id))
-        model = result.scalar_one_or_none()
+        model = await self._session.get(UserModel, user_id)
         return self._to_entity(model) if model else None
 
     async def get_by_email(self, email: str) -> User | None:
-        """Retrieve a user by email address."""
-        result = await self._session.execute(select(UserModel).where(UserModel.email == email))
+        """Retrieve a user by email address, ignoring case."""
+        result = await self._session.execute(_SELECT_BY_EMAIL, {"email": email.lower()})
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
     async def get_by_username(self, username: str) -> User | None:
-        """Retrieve a user by username."""
+        """Retrieve a user by username, ignoring case."""
+        result = await self._session.execute(_SELECT_BY_USERNAME, {"username": username.lower()})
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def get_by_email_or_username(self, email: str, username: str) -> User | None:
+        """Retrieve a user matching either the email address or the username, ignoring case."""
         result = await self._session.execute(
-            select(UserModel).where(UserModel.username == username)
+            _SELECT_BY_EMAIL_OR_USERNAME, {"email": email.lower(), "username": username.lower()}
         )
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        """List all users with pagination."""
-        result = await self._session.execute(select(UserModel).offset(skip).limit(limit))
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        """List all users with pagination.
+
+        Selects plain columns in User field order, so rows skip ORM hydration and
+        map straight onto the entity.
+        """
+        result = await self._session.execute(
+            select(
+                UserModel.id,
+                UserModel.email,
+                UserModel.username,
+                UserModel.full_name,
+                UserModel.is_active,
+                UserModel.created_at,
+                UserModel.updated_at,
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+        return [User(*row) for row in result.all()]
 
     async def create(self, user: User) -> User:
-        """Create a new user."""
-        model = UserModel(
-            email=user.email,
-            username=user.username,
-            full_name=user.full_name,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
+        """Create a new user.
+
+        The timestamps are left to their server defaults and read back via RETURNING.
+        """
+        result = await self._session.execute(
+            insert(UserModel)
+            .values(
+                email=user.email,
+                username=user.username,
+                full_name=user.full_name,
+                is_active=user.is_active,
+            )
+            .returning(UserModel)
         )
-        self._session.add(model)
+        model = result.scalar_one()
         await self._session.commit()
-        await self._session.refresh(model)
         return self._to_entity(model)
 
+    async def create_many(self, users: list[User]) -> list[User]:
+        """Create several users at once.
+
+        SQLAlchemy sends the rows as multi-row INSERT ... RETURNING statements
+        (1000 rows per statement by default) and returns them in input order. The
+        timestamps are left to their server defaults.
+        """
+        if not users:
+            return []
+
+        result = await self._session.execute(
+            insert(UserModel).returning(UserModel, sort_by_parameter_order=True),
+            [
+                {
+                    "email": user.email,
+                    "username": user.username,
+                    "full_name": user.full_name,
+                    "is_active": user.is_active,
+                }
+                for user in users
+            ],
+        )
+        models = result.scalars().all()
+        await self._session.commit()
+        return [self._to_entity(model) for model in models]
+
     async def update(self, user: User) -> User:
         """Update an existing user."""
-        result = await self._session.execute(select(UserModel).where(UserModel.id == user.id))
+        result = await self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(
+                email=user.email,
+                username=user.username,
+                full_name=user.full_name,
+                is_active=user.is_active,
+            )
+            .returning(UserModel)
+        )
         model = result.scalar_one()
-
-        model.email = user.email
-        model.username = user.username
-        model.full_name = user.full_name
-        model.is_active = user.is_active
-        model.updated_at = user.updated_at
-
         await self._session.commit()
-        await self._session.refresh(model)
         return self._to_entity(model)
 
     async def delete(self, user_id: int) -> bool:
         """Delete a user by ID."""
-        result = await self._session.execute(select(UserModel).where(UserModel.id == user_id))
-        model = result.scalar_one_or_none()
-
-        if model:
-            await self._session.delete(model)
-            await self._session.commit()
-            return True
-        return False
+        result = await self._session.execute(
+            delete(UserModel).where(UserModel.id == user_id).returning(UserModel.id)
+        )
+        deleted_id = result.scalar_one_or_none()
+        await self._session.commit()
+        return deleted_id is not None
@@ -0,0 +1,46 @@
+"""Shared test fixtures.
+
+Tests run against an in-memory SQLite database, so no PostgreSQL server is needed.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.api.main import app
+from src.infrastructure.database import models  # noqa: F401  (registers the users table)
+from src.infrastructure.database.connection import Base, get_db
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a session bound to a fresh in-memory database."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """Provide an HTTP client for the app, using the test database session.
+
+    The app lifespan is not run, so the PostgreSQL pool warm-up is skipped.
+    """
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    # httpx 0.26 annotates ASGI apps more narrowly than Starlette's __call__ signature
+    transport = ASGITransport(app=app)  # type: ignore[arg-type]
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
@@ -0,0 +1,136 @@
+"""Tests for the structured logging setup."""
+
+import atexit
+import io
+import logging
+import sys
+import threading
+from pathlib import Path
+
+import orjson
+import pytest
+import structlog
+
+from src.infrastructure.logging.logger import (
+    _BufferedBytesLogger,
+    _open_buffered_stdout,
+    _resolve_log_level,
+)
+
+
+class _RawSink(io.RawIOBase):
+    """Raw stream that records everything flushed to it."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: "bytes | bytearray | memoryview") -> int:  # type: ignore[override]
+        self.data += data
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        return bytes(self.data)
+
+
+def _buffered_stream() -> tuple[io.BufferedWriter, _RawSink]:
+    """Build a block-buffered writer and the raw stream it flushes to."""
+    raw = _RawSink()
+    return io.BufferedWriter(raw, buffer_size=4096), raw
+
+
+def test_low_level_lines_stay_buffered() -> None:
+    """Debug, info and warning lines are not flushed on write."""
+    stream, raw = _buffered_stream()
+    logger = _BufferedBytesLogger(stream)
+
+    logger.debug(b"debug")
+    logger.info(b"info")
+    logger.warning(b"warning")
+
+    assert raw.getvalue() == b""
+    stream.flush()
+    assert raw.getvalue() == b"debug\ninfo\nwarning\n"
+
+
+@pytest.mark.parametrize("method", ["error", "critical", "exception", "fatal"])
+def test_error_lines_flush_with_queued_lines(method: str) -> None:
+    """Error-level lines are flushed at once, together with anything queued before them."""
+    stream, raw = _buffered_stream()
+    logger = _BufferedBytesLogger(stream)
+
+    logger.info(b"queued")
+    getattr(logger, method)(b"failed")
+
+    assert raw.getvalue() == b"queued\nfailed\n"
+
+
+def test_bound_logger_exception_flushes() -> None:
+    """logger.exception() through structlog ends up on the flushing path."""
+    stream, raw = _buffered_stream()
+    bound = structlog.wrap_logger(
+        _BufferedBytesLogger(stream),
+        processors=[structlog.processors.JSONRenderer(serializer=orjson.dumps)],
+        wrapper_class=structlog.make_filtering_bound_logger(20),
+    )
+
+    bound.info("queued")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        bound.exception("failed")
+
+    lines = raw.getvalue().splitlines()
+    assert [orjson.loads(line)["event"] for line in lines] == ["queued", "failed"]
+
+
+def test_open_buffered_stdout_falls_back_without_fileno(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A stdout that is not backed by a file descriptor is used as-is."""
+    fake_stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr(sys, "stdout", fake_stdout)
+    _open_buffered_stdout.cache_clear()
+    try:
+        assert _open_buffered_stdout() is fake_stdout.buffer
+    finally:
+        _open_buffered_stdout.cache_clear()
+
+
+def test_open_buffered_stdout_buffers_the_stdout_fd(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The fd-backed stream is opened once, with a flusher thread and an exit hook."""
+    exit_hooks: list[object] = []
+    monkeypatch.setattr(atexit, "register", exit_hooks.append)
+    with open(tmp_path / "stdout.log", "w") as fake_stdout:
+        monkeypatch.setattr(sys, "stdout", fake_stdout)
+        _open_buffered_stdout.cache_clear()
+        try:
+            stream = _open_buffered_stdout()
+
+            assert isinstance(stream, io.BufferedWriter)
+            assert _open_buffered_stdout() is stream
+            assert exit_hooks == [stream.flush]
+            assert any(thread.name == "log-flusher" for thread in threading.enumerate())
+
+            stream.write(b"line\n")
+            stream.flush()
+        finally:
+            _open_buffered_stdout.cache_clear()
+
+    assert (tmp_path / "stdout.log").read_bytes() == b"line\n"
+
+
+def test_resolve_log_level_accepts_any_case() -> None:
+    """Level names resolve to their numeric value regardless of case."""
+    assert _resolve_log_level("debug") == logging.DEBUG
+    assert _resolve_log_level("WARNING") == logging.WARNING
+
+
+def test_resolve_log_level_rejects_unknown_names() -> None:
+    """Unknown level names raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid log level"):
+        _resolve_log_level("verbose")
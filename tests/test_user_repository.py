@@ -0,0 +1,79 @@
+"""Tests for the SQLAlchemy user repository."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User
+from src.infrastructure.repositories.user_repository import UserRepository
+
+
+def _new_user(email: str, username: str) -> User:
+    """Build an unsaved user entity."""
+    return User(
+        id=None,
+        email=email,
+        username=username,
+        full_name="Test User",
+        is_active=True,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+async def test_create_reads_back_server_timestamps(session: AsyncSession) -> None:
+    """The database assigns the ID and both timestamps on insert."""
+    repo = UserRepository(session)
+
+    created = await repo.create(_new_user("alice@example.com", "alice"))
+
+    assert created.id is not None
+    assert created.created_at is not None
+    assert created.updated_at == created.created_at
+
+
+async def test_get_by_email_or_username_matches_either(session: AsyncSession) -> None:
+    """A match on either the email or the username is returned in one lookup."""
+    repo = UserRepository(session)
+    created = await repo.create(_new_user("alice@example.com", "alice"))
+
+    by_email = await repo.get_by_email_or_username("alice@example.com", "someone-else")
+    by_username = await repo.get_by_email_or_username("other@example.com", "alice")
+    neither = await repo.get_by_email_or_username("other@example.com", "other")
+
+    assert by_email is not None and by_email.id == created.id
+    assert by_username is not None and by_username.id == created.id
+    assert neither is None
+
+
+async def test_lookups_ignore_case(session: AsyncSession) -> None:
+    """Email and username lookups match regardless of case."""
+    repo = UserRepository(session)
+    created = await repo.create(_new_user("Alice@Example.com", "Alice"))
+
+    by_email = await repo.get_by_email("alice@EXAMPLE.com")
+    by_username = await repo.get_by_username("ALICE")
+    by_either = await repo.get_by_email_or_username("ALICE@example.com", "someone-else")
+
+    assert by_email is not None and by_email.id == created.id
+    assert by_username is not None and by_username.id == created.id
+    assert by_either is not None and by_either.id == created.id
+
+
+async def test_create_many_preserves_input_order(session: AsyncSession) -> None:
+    """Created users come back in the order they were passed in, with IDs assigned."""
+    repo = UserRepository(session)
+    users = [_new_user(f"user{i}@example.com", f"user{i}") for i in range(5)]
+
+    created = await repo.create_many(users)
+
+    assert [user.username for user in created] == [user.username for user in users]
+    assert all(user.id is not None for user in created)
+    assert len({user.id for user in created}) == len(users)
+    assert len(await repo.list_all()) == len(users)
+
+
+async def test_create_many_with_no_users_returns_empty_list(session: AsyncSession) -> None:
+    """An empty batch is a no-op."""
+    repo = UserRepository(session)
+
+    assert await repo.create_many([]) == []
+    assert await repo.list_all() == []
@@ -0,0 +1,153 @@
+"""Tests for the user routes and the domain exception handler."""
+
+from fastapi import status
+from httpx import AsyncClient
+
+from src.api.dependencies import get_user_service
+from src.api.main import _domain_exception_status_code, app
+from src.domain.exceptions import (
+    BusinessRuleViolationError,
+    DomainValidationError,
+    EntityAlreadyExistsError,
+    EntityNotFoundError,
+)
+
+USERS_URL = "/api/v1/users/"
+ALICE = {"email": "alice@example.com", "username": "alice", "full_name": "Alice Example"}
+
+
+async def test_create_user_returns_201(client: AsyncClient) -> None:
+    """A new user is created and returned."""
+    response = await client.post(USERS_URL, json=ALICE)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    body = response.json()
+    assert body["email"] == ALICE["email"]
+    assert body["username"] == ALICE["username"]
+    assert body["is_active"] is True
+
+
+async def test_get_user_returns_json(client: AsyncClient) -> None:
+    """A single user is returned as a JSON document."""
+    created = (await client.post(USERS_URL, json=ALICE)).json()
+
+    response = await client.get(f"{USERS_URL}{created['id']}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == created
+
+
+async def test_list_users_returns_page(client: AsyncClient) -> None:
+    """Users are listed in creation order."""
+    await client.post(USERS_URL, json=ALICE)
+    await client.post(
+        USERS_URL, json={"email": "bob@example.com", "username": "bob", "full_name": "Bob"}
+    )
+
+    response = await client.get(USERS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [user["username"] for user in response.json()] == ["alice", "bob"]
+
+
+async def test_update_user_returns_updated_user(client: AsyncClient) -> None:
+    """The updated user is returned."""
+    created = (await client.post(USERS_URL, json=ALICE)).json()
+
+    response = await client.patch(f"{USERS_URL}{created['id']}", json={"full_name": "Alice B"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["full_name"] == "Alice B"
+
+
+async def test_missing_user_returns_404(client: AsyncClient) -> None:
+    """EntityNotFoundError is mapped to 404 with an error body."""
+    response = await client.get(f"{USERS_URL}999")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {
+        "error": "EntityNotFoundError",
+        "message": "User with id 999 not found",
+    }
+
+
+async def test_duplicate_email_returns_409(client: AsyncClient) -> None:
+    """EntityAlreadyExistsError is mapped to 409 with an error body."""
+    await client.post(USERS_URL, json=ALICE)
+
+    response = await client.post(
+        USERS_URL,
+        json={"email": "alice@example.com", "username": "alice2", "full_name": "Alice Two"},
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json() == {
+        "error": "EntityAlreadyExistsError",
+        "message": "User with identifier alice@example.com already exists",
+    }
+
+
+async def test_duplicate_email_with_different_case_returns_409(client: AsyncClient) -> None:
+    """Emails are compared case-insensitively when checking for duplicates."""
+    await client.post(USERS_URL, json=ALICE)
+
+    response = await client.post(
+        USERS_URL,
+        json={"email": "ALICE@example.com", "username": "alice2", "full_name": "Alice Two"},
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json() == {
+        "error": "EntityAlreadyExistsError",
+        "message": "User with identifier ALICE@example.com already exists",
+    }
+
+
+async def test_duplicate_username_returns_409(client: AsyncClient) -> None:
+    """Usernames are also compared case-insensitively."""
+    await client.post(USERS_URL, json=ALICE)
+
+    response = await client.post(
+        USERS_URL,
+        json={"email": "other@example.com", "username": "Alice", "full_name": "Alice Two"},
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json() == {
+        "error": "EntityAlreadyExistsError",
+        "message": "User with identifier Alice already exists",
+    }
+
+
+async def test_domain_validation_error_returns_400(client: AsyncClient) -> None:
+    """DomainValidationError is mapped to 400 with an error body."""
+
+    class FailingUserService:
+        async def get_user_by_id(self, user_id: int) -> None:
+            raise DomainValidationError("Invalid user")
+
+    app.dependency_overrides[get_user_service] = FailingUserService
+
+    response = await client.get(f"{USERS_URL}1")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"error": "DomainValidationError", "message": "Invalid user"}
+
+
+def test_unmapped_domain_exception_has_no_status_code() -> None:
+    """Domain exceptions without a mapping are left to the handler's 400 fallback."""
+    assert _domain_exception_status_code(BusinessRuleViolationError("no")) is None
+
+
+def test_domain_exception_subclasses_inherit_status_code() -> None:
+    """Subclasses of mapped exceptions resolve to their parent's status code."""
+
+    class UserNotFoundError(EntityNotFoundError):
+        pass
+
+    class DuplicateEmailError(EntityAlreadyExistsError):
+        pass
+
+    assert _domain_exception_status_code(UserNotFoundError("User", 1)) == 404
+    assert _domain_exception_status_code(DuplicateEmailError("User", "a@b.c")) == 409